@@ -0,0 +1,66 @@
+import functools
+import hashlib
+import json
+from http import HTTPStatus
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from organizations.models import EgrulVersion
+
+RESPONSE_CACHE_PREFIX = 'api-response'
+
+
+def normalize_query_params(request):
+    """Возвращает отсортированные непустые параметры запроса.
+    Параметр полнотекстового поиска `q` приводится к нижнему регистру,
+    лишние пробелы отбрасываются."""
+
+    params = []
+    for key, values in request.query_params.lists():
+        for value in values:
+            if key == 'q':
+                value = ' '.join(value.split()).lower()
+            if value:
+                params.append((key, value))
+    return sorted(params)
+
+
+def get_version_stamp():
+    """Возвращает отметку актуальной версии ЕГРЮЛ."""
+
+    version = EgrulVersion.get_current()
+    return version.get_stamp() if version else None
+
+
+def get_response_cache_key(request, version_stamp):
+    """Возвращает ключ кэша ответа для версии ЕГРЮЛ `version_stamp`."""
+
+    raw = json.dumps([request.build_absolute_uri(request.path),
+                      normalize_query_params(request),
+                      version_stamp],
+                     ensure_ascii=False)
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f'{RESPONSE_CACHE_PREFIX}:{digest}'
+
+
+def cache_response(view_method):
+    """
+    Кэширует успешные ответы метода вью-сета.
+    Ключ кэша учитывает версию ЕГРЮЛ, поэтому после сохранения
+    новых сведений `OrgSaver` кэшированные ответы перестают использоваться.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        key = get_response_cache_key(request, get_version_stamp())
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        response = view_method(view, request, *args, **kwargs)
+        if response.status_code == HTTPStatus.OK:
+            cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+        return response
+
+    return wrapper
@@ -1,14 +1,287 @@
+import base64
+import binascii
+import json
+import operator
+import sys
+from functools import reduce
+
 from django.conf import settings
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from organizations.models import EgrulVersion
 
+COUNT_EXACT = 'exact'
+COUNT_ESTIMATED = 'estimated'
+COUNT_CAPPED = 'capped'
+COUNT_NONE = 'none'
+
+
+def get_estimated_count(queryset) -> int:
+    """Возвращает оценку количества строк запроса
+    по плану планировщика PostgreSQL (`EXPLAIN`), не выполняя запрос."""
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cur:
+        cur.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cur.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def get_date_info():
+    """Возвращает дату актуальности ЕГРЮЛ."""
+
+    return (
+        EgrulVersion
+        .objects
+        .values_list('version', flat=True)
+        .first()
+    )
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Пагинатор с оценкой количества объектов от планировщика PostgreSQL.
+    Если оценка меньше `exact_count_threshold`, то объекты
+    подсчитываются точно.
+    """
+
+    count_is_exact = False
+
+    @cached_property
+    def exact_count_threshold(self):
+        return settings.PAGINATION_EXACT_COUNT_THRESHOLD
+
+    @cached_property
+    def count(self):
+        estimate = get_estimated_count(self.object_list)
+        if estimate < self.exact_count_threshold:
+            self.count_is_exact = True
+            return super().count
+        return estimate
+
+
+class CappedCountPaginator(Paginator):
+    """
+    Пагинатор, подсчитывающий не более `count_cap` объектов.
+    Страницы за пределами `count_cap` объектов недоступны.
+    """
+
+    count_is_exact = True
+
+    @cached_property
+    def count_cap(self):
+        return settings.PAGINATION_COUNT_CAP
+
+    @cached_property
+    def count(self):
+        count = self.object_list[:self.count_cap + 1].count()
+        if count > self.count_cap:
+            self.count_is_exact = False
+            return self.count_cap
+        return count
+
+
+class NoCountPage(Page):
+    """Страница, наличие следующей страницы у которой
+    известно заранее."""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self.next_exists = has_next
+
+    def has_next(self):
+        return self.next_exists
+
+
+class NoCountPaginator(Paginator):
+    """
+    Пагинатор без подсчета количества объектов.
+    Запрашивает на одну запись больше размера страницы,
+    чтобы определить наличие следующей страницы.
+    """
+
+    count = None
+    count_is_exact = False
+    num_pages = sys.maxsize
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        has_next = len(rows) > self.per_page
+        self.num_pages = number + has_next
+        return NoCountPage(rows[:self.per_page], number, self, has_next)
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Курсорная (keyset) пагинация по ключу сортировки запроса.
+
+    Ключом служат поля сортировки запроса, дополненные `id`
+    для уникальности. Вместо `OFFSET` страница выбирается условием
+    "строки после ключа последней строки предыдущей страницы",
+    поэтому стоимость страницы не зависит от ее глубины.
+    Курсор непрозрачен для клиента и содержит ключ граничной строки
+    и направление.
+    """
+
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = _('Некорректный курсор.')
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+
+    @staticmethod
+    def get_row_value(row, field):
+        if isinstance(row, dict):
+            return row[field]
+        return getattr(row, field)
+
+    @staticmethod
+    def get_beyond_filter(field, value, descending):
+        """Возвращает условие "строго после значения `value`" с учетом
+        расположения NULL в PostgreSQL (последние при ASC,
+        первые при DESC). None означает пустое условие."""
+
+        if descending:
+            if value is None:
+                return Q(**{f'{field}__isnull': False})
+            return Q(**{f'{field}__lt': value})
+        if value is None:
+            return None
+        return Q(**{f'{field}__gt': value}) | Q(**{f'{field}__isnull': True})
+
+    def get_keyset_filter(self, position, reverse):
+        """Возвращает условие "строки после ключа `position`"
+        по полям сортировки `self.ordering`."""
+
+        conditions = []
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            beyond = self.get_beyond_filter(name, value, descending)
+            if beyond is not None:
+                conditions.append(equal & beyond)
+            if value is None:
+                equal &= Q(**{f'{name}__isnull': True})
+            else:
+                equal &= Q(**{name: value})
+        if not conditions:
+            return Q(pk__in=[])
+        return reduce(operator.or_, conditions)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            position, reverse = cursor['p'], bool(cursor['r'])
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or (
+                len(position) != len(self.ordering)):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, row, reverse):
+        position = [self.get_row_value(row, field.lstrip('-'))
+                    for field in self.ordering]
+        cursor = json.dumps({'p': position, 'r': int(reverse)},
+                            ensure_ascii=False)
+        encoded = base64.urlsafe_b64encode(cursor.encode()).decode()
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, CustomNumberPagination.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = [field for field in queryset.query.order_by
+                         if isinstance(field, str)]
+        if not {'id', '-id', 'pk', '-pk'} & set(self.ordering):
+            self.ordering.append('id')
+        position, reverse = self.decode_cursor(request)
+        if reverse:
+            queryset = queryset.order_by(*[
+                field[1:] if field.startswith('-') else f'-{field}'
+                for field in self.ordering
+            ])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            queryset = queryset.filter(
+                self.get_keyset_filter(position, reverse))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.rows = rows[:self.page_size]
+        if reverse:
+            self.rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        return self.rows
+
+    def get_next_link(self):
+        if not (self.has_next and self.rows):
+            return None
+        return self.encode_cursor(self.rows[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.rows):
+            return None
+        return self.encode_cursor(self.rows[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': None,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'date_info': get_date_info(),
+            'results': data,
+        })
+
 
 class CustomNumberPagination(pagination.PageNumberPagination):
+    """
+    Постраничная пагинация с датой актуальности ЕГРЮЛ.
+
+    Способ подсчета количества объектов задается атрибутом `count_mode`
+    или, если он не задан, настройкой `PAGINATION_COUNT_MODES`
+    для действия вью-сета:
+        exact - точный подсчет (`COUNT(*)`);
+        estimated - оценка планировщика PostgreSQL;
+        capped - точный подсчет не более `PAGINATION_COUNT_CAP` объектов;
+        none - без подсчета, только признак наличия следующей страницы.
+
+    Если в запросе передан параметр `cursor` (в т.ч. пустой), то вместо
+    постраничной используется курсорная пагинация `KeysetPagination`.
+    """
+
     page_query_description = _('Номер страницы')
     page_size = None
+    count_mode = None
+
+    paginator_classes = {
+        COUNT_EXACT: Paginator,
+        COUNT_ESTIMATED: EstimatedCountPaginator,
+        COUNT_CAPPED: CappedCountPaginator,
+        COUNT_NONE: NoCountPaginator,
+    }
 
     def get_page_size(self, request):
         page_size = super().get_page_size(request)
@@ -16,19 +289,35 @@ class CustomNumberPagination(pagination.PageNumberPagination):
             return settings.REST_FRAMEWORK['PAGE_SIZE']
         return page_size
 
+    def get_count_mode(self, view):
+        if self.count_mode is not None:
+            return self.count_mode
+        action = getattr(view, 'action', None)
+        return settings.PAGINATION_COUNT_MODES.get(action, COUNT_EXACT)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if KeysetPagination.cursor_query_param in request.query_params:
+            self.keyset = KeysetPagination(self.get_page_size(request))
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.django_paginator_class = self.paginator_classes[
+            self.get_count_mode(view)]
+        return super().paginate_queryset(queryset, request, view)
+
     def get_paginated_response(self, data):
-        return Response({
-            'count': self.page.paginator.count,
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        paginator = self.page.paginator
+        response = {'count': paginator.count}
+        if self.django_paginator_class is not Paginator:
+            response['count_is_exact'] = paginator.count_is_exact
+        response.update({
             'next': self.get_next_link(),
             'previous': self.get_previous_link(),
-            'date_info': (
-                EgrulVersion
-                .objects
-                .values_list('version', flat=True)
-                .first()
-            ),
+            'date_info': get_date_info(),
             'results': data,
         })
+        return Response(response)
 
     def get_paginated_response_schema(self, schema):
         return {
@@ -37,9 +326,16 @@ class CustomNumberPagination(pagination.PageNumberPagination):
             'properties': {
                 'count': {
                     'type': 'integer',
+                    'nullable': True,
                     'example': 322,
                     'description': 'Общее количество объектов',
                 },
+                'count_is_exact': {
+                    'type': 'boolean',
+                    'description': ('Точное ли количество объектов '
+                                    '(только для неточных способов '
+                                    'подсчета)'),
+                },
                 'next': {
                     'type': 'string',
                     'nullable': True,
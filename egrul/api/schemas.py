@@ -18,12 +18,24 @@ RESPONSES_FOR_FTS_SEARCH = {
                                               "параметр q."}
                             })
 }
+CURSOR_PARAM = openapi.Parameter(
+    "cursor",
+    openapi.IN_QUERY,
+    required=False,
+    description=("Курсор для курсорной пагинации. Пустое значение - "
+                 "первая страница, далее - ссылки next/previous. "
+                 "Стоимость страницы не зависит от ее глубины"),
+    type=openapi.TYPE_STRING)
+
+PARAMS_FOR_LIST = [CURSOR_PARAM]
+
 PARAMS_FOR_FTS_SEARCH = [
     openapi.Parameter("q",
                       openapi.IN_QUERY,
                       required=True,
                       description="Параметр полнотекстового поиска",
-                      type=openapi.TYPE_STRING)
+                      type=openapi.TYPE_STRING),
+    CURSOR_PARAM
 ]
 
 DOC_CONSTS = {
@@ -33,7 +45,8 @@ DOC_CONSTS = {
             "summary": "Список организаций",
             "description": ("Страница доступна всем пользователям. "
                             "Доступна фильтрация по ИНН, КПП, ОГРН."),
-            "responses": []
+            "responses": [],
+            "params": PARAMS_FOR_LIST
         },
     "retrieve":
         {
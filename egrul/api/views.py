@@ -9,6 +9,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from organizations.models import Organization
+from .cache import cache_response
 from .filters import OrganizationFilter
 from .mixins import RetrieveListViewSet
 from .paginators import CustomNumberPagination
@@ -23,7 +24,8 @@ from .serializers import (OrganizationListSerializer,
         tags=DOC_CONSTS["list"]["tags"],
         operation_summary=DOC_CONSTS["list"]["summary"],
         operation_description=DOC_CONSTS["list"]["description"],
-        pagination_class=CustomNumberPagination)
+        pagination_class=CustomNumberPagination,
+        manual_parameters=DOC_CONSTS["list"]["params"])
 )
 @method_decorator(
     name="retrieve",
@@ -46,7 +48,7 @@ class OrganizationViewSet(RetrieveListViewSet):
         .objects
         .only('full_name', 'short_name', 'inn', 'kpp', 'ogrn',
               'factual_address', 'region_code')
-        .all()
+        .order_by('id')
     )
 
     serializer_class = OrganizationListSerializer
@@ -54,6 +56,14 @@ class OrganizationViewSet(RetrieveListViewSet):
     filterset_class = OrganizationFilter
     pagination_class = CustomNumberPagination
 
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     @swagger_auto_schema(
         name="list-fts",
         tags=DOC_CONSTS["list-fts"]["tags"],
@@ -65,6 +75,7 @@ class OrganizationViewSet(RetrieveListViewSet):
     )
     @action(detail=False, methods=['GET'], url_path='fts-search',
             filter_backends=[])
+    @cache_response
     def fts_search(self, request):
         """Полнотекстовый поиск организаций по параметру q."""
 
@@ -74,7 +85,7 @@ class OrganizationViewSet(RetrieveListViewSet):
             rank = SearchRank(F('full_name_search'), query)
             orgs = (Organization.objects.annotate(rank=rank)
                     .filter(full_name_search=query)
-                    .order_by('-rank', 'full_name', 'inn')
+                    .order_by('-rank', 'full_name', 'inn', 'id')
                     )
             page = self.paginate_queryset(orgs)
             serializer = self.get_serializer(page, many=True)
@@ -72,6 +72,21 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND',
+                             'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'egrul'),
+        'KEY_PREFIX': 'egrul',
+    }
+}
+if CACHES['default']['BACKEND'].endswith('LocMemCache'):
+    CACHES['default']['OPTIONS'] = {
+        'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', 10000))
+    }
+
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', 60 * 60 * 24))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -108,6 +123,14 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 20
 }
 
+PAGINATION_COUNT_MODES = {
+    'list': os.getenv('LIST_COUNT_MODE', 'exact'),
+    'fts_search': os.getenv('FTS_SEARCH_COUNT_MODE', 'exact'),
+}
+PAGINATION_COUNT_CAP = int(os.getenv('PAGINATION_COUNT_CAP', 10000))
+PAGINATION_EXACT_COUNT_THRESHOLD = int(
+    os.getenv('PAGINATION_EXACT_COUNT_THRESHOLD', 1000))
+
 LOGGING = {
     'version': 1,
     'filters': {
@@ -2,7 +2,7 @@ import abc
 import datetime
 from multiprocessing import Pool, RLock
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
@@ -98,11 +98,16 @@ class EgrulHandler(Handler):
         Путь до XML-файлов ЕГРЮЛ
     is_update : bool
         Признак обновления или заполнения БД с нуля
+    pool : Pool (по умолчанию None)
+        Внешний пул процессов. Если не передан, то пул создается
+        на время обработки и закрывается по ее окончании
 
     Методы
     -------
     handle() -> Dict[str, Union[int, str]]
         Управляет обработкой сведениями из XML-файлов ЕГРЮЛ
+    handle_files(xml_files: List[Path]) -> Dict[str, Union[int, str]]
+        Обрабатывает переданные XML-файлы ЕГРЮЛ
     divide_all_xml_into_equal_chunks(self, xml_files: List[Path])
      -> List[List[Path]]
         Разделяет объекты типа `Path` на равные куски
@@ -116,10 +121,15 @@ class EgrulHandler(Handler):
         Взаимодействует с БД
     """
 
-    def __init__(self, cpu_count: int, dir_name: str, is_update: bool) -> None:
+    def __init__(self,
+                 cpu_count: int,
+                 dir_name: str,
+                 is_update: bool,
+                 pool: Optional[Pool] = None) -> None:
         self.cpu_count = cpu_count
         self.dir_name = dir_name
         self.is_update = is_update
+        self.pool = pool
 
     def divide_all_xml_into_equal_chunks(self,
                                          xml_files: List[Path]
@@ -184,20 +194,35 @@ class EgrulHandler(Handler):
         Управляет логикой обработки сведениями из XML-файлов ЕГРЮЛ.
 
         1) Ищем рекурсивно XML-файлы;
-        2) Делим XML-файлы на равные куски в зависимости от кол-ва процессов;
-        3) Создаем пул процессов;
-        4) Создаем задачи для процессов;
-        5) Запускаем задачи и соединяем результаты выполнения задач;
-        6) Взаимодействуем с БД;
-        7) Возвращаем отчет по результатам обработки.
+        2) Обрабатываем найденные XML-файлы.
         """
         xml_files = list(Path(self.dir_name).rglob('*.XML'))
         if not xml_files:
             return {'Возникла ошибка': 'Отсутствуют подходящие XML-файлы'}
+        return self.handle_files(xml_files)
+
+    def handle_files(self,
+                     xml_files: List[Path]) -> Dict[str, Union[int, str]]:
+        """
+        Обрабатывает переданные XML-файлы ЕГРЮЛ.
+
+        1) Делим XML-файлы на равные куски в зависимости от кол-ва процессов;
+        2) Берем внешний пул процессов или создаем собственный;
+        3) Создаем задачи для процессов;
+        4) Запускаем задачи и соединяем результаты выполнения задач;
+        5) Взаимодействуем с БД;
+        6) Возвращаем отчет по результатам обработки.
+        """
         chunked_xml_paths = self.divide_all_xml_into_equal_chunks(xml_files)
-        pool = Pool(processes=self.cpu_count, initargs=(RLock(),))
-        jobs = self.create_jobs(pool, chunked_xml_paths)
-        orgs_to_save, orgs_to_delete, sts = self.merge_results_from_jobs(jobs)
+        if self.pool is not None:
+            jobs = self.create_jobs(self.pool, chunked_xml_paths)
+            orgs_to_save, orgs_to_delete, sts = self.merge_results_from_jobs(
+                jobs)
+        else:
+            with Pool(processes=self.cpu_count, initargs=(RLock(),)) as pool:
+                jobs = self.create_jobs(pool, chunked_xml_paths)
+                orgs_to_save, orgs_to_delete, sts = (
+                    self.merge_results_from_jobs(jobs))
         self.interact_with_db(orgs_to_save, orgs_to_delete)
         return sts
 
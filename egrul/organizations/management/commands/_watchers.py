@@ -0,0 +1,149 @@
+import abc
+import ctypes
+import ctypes.util
+import os
+import select
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+
+class DirWatcher(abc.ABC):
+    """
+    Наблюдатель за директорией с XML-файлами ЕГРЮЛ.
+
+    Файл считается готовым к обработке, если он не изменялся
+    последние `settle` секунд, и еще не обрабатывался в текущем
+    виде (размер и время изменения не совпадают с обработанными).
+
+    Атрибуты
+    ----------
+    dir_name : str
+        Путь до директории с XML-файлами ЕГРЮЛ
+    settle : float
+        Количество секунд без изменений, после которых файл
+        считается полностью записанным
+
+    Методы
+    -------
+    wait(timeout: float)
+        Абстрактный метод ожидания изменений в директории
+    get_ready_files() -> List[Path]
+        Возвращает полностью записанные и еще не обработанные XML-файлы
+    mark_processed(xml_files: Iterable[Path])
+        Помечает XML-файлы обработанными
+    close()
+        Освобождает ресурсы наблюдателя
+    """
+
+    def __init__(self, dir_name: str, settle: float) -> None:
+        self.dir_name = Path(dir_name)
+        self.settle = settle
+        self.processed: Dict[Path, Tuple[int, int]] = {}
+        self.candidates: Dict[Path, Tuple[int, int]] = {}
+
+    @abc.abstractmethod
+    def wait(self, timeout: float) -> None:
+        """Блокирует выполнение до изменений в директории
+        или до истечения `timeout` секунд."""
+        pass
+
+    def get_ready_files(self) -> List[Path]:
+        """Возвращает полностью записанные и еще не обработанные XML-файлы."""
+        now = time.time()
+        self.candidates = {}
+        existing = set()
+        for path in sorted(self.dir_name.rglob('*.XML')):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            existing.add(path)
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self.processed.get(path) == signature:
+                continue
+            if now - stat.st_mtime < self.settle:
+                continue
+            self.candidates[path] = signature
+        for path in set(self.processed) - existing:
+            del self.processed[path]
+        return list(self.candidates)
+
+    def mark_processed(self, xml_files: Iterable[Path]) -> None:
+        """Помечает XML-файлы обработанными в том виде,
+        в котором они были отобраны `get_ready_files`."""
+        for path in xml_files:
+            self.processed[path] = self.candidates.pop(path)
+
+    def close(self) -> None:
+        """Освобождает ресурсы наблюдателя."""
+        pass
+
+
+class PollingWatcher(DirWatcher):
+    """Наблюдатель, периодически опрашивающий директорию."""
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(timeout)
+
+
+class InotifyWatcher(DirWatcher):
+    """
+    Наблюдатель на основе inotify (только Linux).
+
+    Пробуждается сразу после записи или перемещения файлов
+    в директорию, не дожидаясь истечения интервала опроса.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    def __init__(self, dir_name: str, settle: float) -> None:
+        super().__init__(dir_name, settle)
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.add_watches()
+
+    def add_watches(self) -> None:
+        """Ставит на наблюдение директорию и все ее поддиректории."""
+        dirs = [self.dir_name]
+        dirs.extend(path for path in self.dir_name.rglob('*') if path.is_dir())
+        for path in dirs:
+            wd = self.libc.inotify_add_watch(
+                self.fd, os.fsencode(path), self.MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), 'inotify_add_watch failed')
+
+    def wait(self, timeout: float) -> None:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        self.add_watches()
+        if self.settle:
+            time.sleep(self.settle)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def get_watcher(dir_name: str,
+                settle: float,
+                use_polling: bool = False) -> DirWatcher:
+    """Возвращает наблюдатель на основе inotify,
+    а при его недоступности - опрашивающий наблюдатель."""
+    if not use_polling:
+        try:
+            return InotifyWatcher(dir_name, settle)
+        except (AttributeError, OSError):
+            pass
+    return PollingWatcher(dir_name, settle)
@@ -0,0 +1,106 @@
+from multiprocessing import Pool, RLock
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection
+
+from ._handlers import EgrulHandler
+from ._watchers import get_watcher
+
+
+class Command(BaseCommand):
+    """Management-команда для непрерывного применения
+    обновлений ЕГРЮЛ из XML-файлов по мере их появления в директории."""
+
+    help = ('Следит за директорией и применяет обновления ЕГРЮЛ'
+            ' небольшими порциями по мере поступления XML-файлов')
+
+    def add_arguments(self, parser):
+        parser.add_argument('dir_name',
+                            type=str,
+                            help=('Путь до директории,'
+                                  ' в которую поступают XML-файлы ЕГРЮЛ')
+                            )
+        parser.add_argument('-n', '--proc-num',
+                            type=int,
+                            dest='N',
+                            choices=range(1, 9),
+                            metavar="[1-8]",
+                            default=1,
+                            help=('Количество процессов [1-8]'
+                                  ' (по умолчанию: 1)')
+                            )
+        parser.add_argument('--batch-size',
+                            type=int,
+                            default=50,
+                            help=('Максимальное количество XML-файлов'
+                                  ' в одной порции (по умолчанию: 50)')
+                            )
+        parser.add_argument('--interval',
+                            type=float,
+                            default=10,
+                            help=('Интервал опроса директории в секундах'
+                                  ' (по умолчанию: 10)')
+                            )
+        parser.add_argument('--settle',
+                            type=float,
+                            default=30,
+                            help=('Количество секунд без изменений, после'
+                                  ' которых файл считается полностью'
+                                  ' записанным (по умолчанию: 30)')
+                            )
+        parser.add_argument('--skip-existing',
+                            action='store_true',
+                            help=('Не применять XML-файлы, которые уже'
+                                  ' лежат в директории на момент запуска')
+                            )
+        parser.add_argument('--polling',
+                            action='store_true',
+                            help='Не использовать inotify, только опрос')
+        parser.add_argument('--once',
+                            action='store_true',
+                            help=('Применить готовые XML-файлы'
+                                  ' и завершить работу')
+                            )
+
+    @staticmethod
+    def ensure_db_connection():
+        """Закрывает сломанное соединение с БД, чтобы следующая
+        порция открыла новое. Рабочее соединение переиспользуется."""
+        if connection.connection is not None and not connection.is_usable():
+            connection.close()
+
+    def handle(self, *args, **options):
+        batch_size = options.get('batch_size')
+        watcher = get_watcher(dir_name=options.get('dir_name'),
+                              settle=options.get('settle'),
+                              use_polling=options.get('polling'))
+        if options.get('skip_existing'):
+            watcher.mark_processed(watcher.get_ready_files())
+
+        with Pool(processes=options.get('N'), initargs=(RLock(),)) as pool:
+            handler = EgrulHandler(cpu_count=options.get('N'),
+                                   dir_name=options.get('dir_name'),
+                                   is_update=True,
+                                   pool=pool)
+            try:
+                while True:
+                    ready = watcher.get_ready_files()
+                    for i in range(0, len(ready), batch_size):
+                        batch = ready[i:i + batch_size]
+                        self.ensure_db_connection()
+                        try:
+                            stats = handler.handle_files(batch)
+                        except DatabaseError as e:
+                            self.stderr.write(f'Ошибка БД: {e}')
+                            connection.close()
+                            break
+                        watcher.mark_processed(batch)
+                        for stat in stats:
+                            self.stdout.write(f'{stat}: {stats[stat]}')
+                    if options.get('once'):
+                        break
+                    watcher.wait(options.get('interval'))
+            except KeyboardInterrupt:
+                pass
+            finally:
+                watcher.close()
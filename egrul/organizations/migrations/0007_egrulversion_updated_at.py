@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-19 13:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0006_organization_is_main'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='egrulversion',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='Дата и время последнего изменения сведений в БД'),
+        ),
+    ]
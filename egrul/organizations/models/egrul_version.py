@@ -1,9 +1,23 @@
+from typing import Optional
+
 from django.db import models
 
 
 class EgrulVersion(models.Model):
     id = models.SmallIntegerField(primary_key=True)
     version = models.DateField()
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text='Дата и время последнего изменения сведений в БД')
+
+    @classmethod
+    def get_current(cls) -> Optional['EgrulVersion']:
+        """Возвращает актуальную версию ЕГРЮЛ или None, если БД пуста."""
+        return cls.objects.filter(pk=1).first()
+
+    def get_stamp(self) -> str:
+        """Возвращает отметку, меняющуюся при каждом изменении сведений."""
+        return self.updated_at.isoformat()
 
     def __str__(self):
         return f'<Версия от {self.version}>'
@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import cache
 
 
 @pytest.fixture
@@ -7,3 +8,10 @@ def reset_page_size(settings):
     settings.REST_FRAMEWORK['PAGE_SIZE'] = 1
     yield
     settings.REST_FRAMEWORK['PAGE_SIZE'] = page
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
@@ -1,3 +1,5 @@
+import shutil
+
 import pytest
 from django.core.management import CommandError
 
@@ -196,3 +198,50 @@ class TestFillEgrul:
             short_name='ООО "ЛИКВИДИРОВАНО"'
         ).first()
         assert not liquidated_org, 'Ликвидированная организация попала в БД'
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+class TestWatchEgrul:
+    """
+    Здесь проверяются:
+    применение поступивших XML-файлов командой watch_egrul;
+    пропуск уже обработанных и уже лежащих в директории XML-файлов.
+    """
+
+    ORGS_COUNT = 5
+    UPD_ORGS_COUNT = 2
+
+    EGRUL_FILL_COMMAND = 'fill_egrul'
+    EGRUL_WATCH_COMMAND = 'watch_egrul'
+    EGRUL_PATH_DIR = 'tests/fixtures/fill'
+    EGRUL_UPD_FILE = 'tests/fixtures/update/update.XML'
+    EGRUL_SUCCESS_MSG = ('Обработано файлов: 1\n'
+                         'Новых или измененных организаций залито: 5\n')
+    EGRUL_SUCCESS_UPD_MSG = ('Обработано файлов: 1\n'
+                             'Новых или измененных организаций залито:'
+                             f' {UPD_ORGS_COUNT}\n')
+
+    @pytest.fixture
+    def watched_dir(self, tmp_path, make_call_command):
+        make_call_command(self.EGRUL_FILL_COMMAND, self.EGRUL_PATH_DIR,
+                          stdout_message=self.EGRUL_SUCCESS_MSG)
+        shutil.copy(self.EGRUL_UPD_FILE, tmp_path)
+        return tmp_path
+
+    def test_01_applies_new_files(self, make_call_command, watched_dir):
+        make_call_command(self.EGRUL_WATCH_COMMAND, str(watched_dir),
+                          once=True, settle=0, polling=True,
+                          stdout_message=self.EGRUL_SUCCESS_UPD_MSG)
+        assert Organization.objects.all().count() == self.UPD_ORGS_COUNT
+
+    def test_02_skip_existing(self, make_call_command, watched_dir):
+        make_call_command(self.EGRUL_WATCH_COMMAND, str(watched_dir),
+                          once=True, settle=0, skip_existing=True,
+                          stdout_message='')
+        assert Organization.objects.all().count() == self.ORGS_COUNT
+
+    def test_03_not_settled(self, make_call_command, watched_dir):
+        make_call_command(self.EGRUL_WATCH_COMMAND, str(watched_dir),
+                          once=True, settle=3600,
+                          stdout_message='')
+        assert Organization.objects.all().count() == self.ORGS_COUNT
@@ -0,0 +1,60 @@
+import pytest
+
+from organizations.management.commands._handlers import OrgSaver
+from organizations.models import Organization
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+class TestAPIResponseCache:
+    """
+    Тестер кэширования ответов API.
+
+    Здесь проверяются:
+        Повторный запрос обслуживается без запросов к организациям.
+        Нормализация параметра q в ключе кэша.
+        Сброс кэша при сохранении новых сведений.
+    """
+
+    LIST_URL = '/api/organizations/'
+    DETAIL_URL = '/api/organizations/1/'
+    FTS_URL = '/api/organizations/fts-search/'
+    QUERY_PARAM = {"q": "магия"}
+    VERSION_QUERIES_NUM = 1
+
+    def test_01_cached_fts(self, user_client, organization_1,
+                           django_assert_num_queries) -> None:
+        r1 = user_client.get(self.FTS_URL, data=self.QUERY_PARAM).data
+        with django_assert_num_queries(self.VERSION_QUERIES_NUM):
+            r2 = user_client.get(self.FTS_URL, data=self.QUERY_PARAM).data
+        assert r1 == r2, 'Кэшированный ответ отличается от исходного'
+
+    def test_02_cached_list_and_retrieve(self, user_client, organization_1,
+                                         django_assert_num_queries) -> None:
+        for url in (self.LIST_URL, self.DETAIL_URL):
+            r1 = user_client.get(url).data
+            with django_assert_num_queries(self.VERSION_QUERIES_NUM):
+                r2 = user_client.get(url).data
+            assert r1 == r2, 'Кэшированный ответ отличается от исходного'
+
+    def test_03_normalized_q(self, user_client, organization_1,
+                             django_assert_num_queries) -> None:
+        user_client.get(self.FTS_URL, data=self.QUERY_PARAM)
+        with django_assert_num_queries(self.VERSION_QUERIES_NUM):
+            r = user_client.get(self.FTS_URL, data={"q": "  МАГИЯ "}).data
+        assert len(r['results']) == 1
+
+    def test_04_invalidated_by_saver(self, user_client,
+                                     organization_1) -> None:
+        r1 = user_client.get(self.FTS_URL, data=self.QUERY_PARAM).data
+        assert r1['count'] == 1
+        OrgSaver().save([Organization(
+            full_name='ДЕПАРТАМЕНТ МАГИИ',
+            short_name='ДЕПАРТАМЕНТ МАГИИ',
+            inn='7777777778',
+            ogrn='8888888888889',
+            kpp='999999998',
+            factual_address='УЛ. ВОЛШЕБНИКОВ, Г. МОСКВА, 125212',
+            region_code='77'
+        )])
+        r2 = user_client.get(self.FTS_URL, data=self.QUERY_PARAM).data
+        assert r2['count'] == 2, 'Кэш не сброшен после обновления сведений'
@@ -0,0 +1,140 @@
+import pytest
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+class TestAPICountModes:
+    """
+    Тестер способов подсчета количества организаций при пагинации.
+
+    Здесь проверяются:
+        Оценка количества планировщиком PostgreSQL.
+        Ограниченный подсчет.
+        Пагинация без подсчета.
+    """
+
+    URL = '/api/organizations/'
+    FTS_URL = '/api/organizations/fts-search/'
+    QUERY_PARAM = {"q": "министерство"}
+
+    @pytest.fixture
+    def count_mode(self, settings):
+        def _count_mode(mode):
+            settings.PAGINATION_COUNT_MODES = {'list': mode,
+                                               'fts_search': mode}
+        return _count_mode
+
+    def test_01_exact_by_default(self, user_client, organization_1) -> None:
+        result = user_client.get(self.URL).data
+        assert result['count'] == 1
+        assert 'count_is_exact' not in result
+
+    def test_02_estimated_below_threshold(self, user_client, count_mode,
+                                          organization_1,
+                                          organization_2) -> None:
+        count_mode('estimated')
+        result = user_client.get(self.URL).data
+        assert result['count'] == 2
+        assert result['count_is_exact'] is True
+
+    def test_03_estimated(self, user_client, count_mode, settings,
+                          organization_1, organization_2) -> None:
+        count_mode('estimated')
+        settings.PAGINATION_EXACT_COUNT_THRESHOLD = 0
+        result = user_client.get(self.FTS_URL, data=self.QUERY_PARAM).data
+        assert isinstance(result['count'], int)
+        assert result['count_is_exact'] is False
+
+    def test_04_capped(self, user_client, count_mode, settings,
+                       organization_1, organization_2,
+                       unit_of_organization_1) -> None:
+        count_mode('capped')
+        settings.PAGINATION_COUNT_CAP = 2
+        result = user_client.get(self.URL).data
+        assert result['count'] == 2
+        assert result['count_is_exact'] is False
+        settings.PAGINATION_COUNT_CAP = 3
+        result = user_client.get(self.URL, data={'page': 1}).data
+        assert result['count'] == 3
+        assert result['count_is_exact'] is True
+
+    def test_05_no_count(self, user_client, count_mode, organization_1,
+                         organization_2, reset_page_size) -> None:
+        count_mode('none')
+        result = user_client.get(self.URL).data
+        assert result['count'] is None
+        assert len(result['results']) == 1
+        assert result['next'], 'Отсутствует ссылка на след. страницу'
+        assert not result['previous']
+        result2 = user_client.get(result['next']).data
+        assert len(result2['results']) == 1
+        assert not result2['next'], 'Появилась лишняя ссылка на след. стр.'
+        assert result2['previous'], 'Отсутствует ссылка на пред. страницу'
+
+    def test_06_no_count_out_of_range(self, user_client, count_mode,
+                                      organization_1) -> None:
+        count_mode('none')
+        assert user_client.get(self.URL, data={'page': 5}).status_code == 404
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+class TestAPIKeysetPagination:
+    """
+    Тестер курсорной пагинации.
+
+    Здесь проверяются:
+        Обход списка организаций вперед и назад.
+        Порядок результатов полнотекстового поиска.
+        Обработка некорректного курсора.
+    """
+
+    URL = '/api/organizations/'
+    FTS_URL = '/api/organizations/fts-search/'
+    RESPONSE_KEYS = ('count', 'next', 'previous', 'date_info', 'results')
+
+    @staticmethod
+    def walk(client, url, params, link='next'):
+        pages = []
+        result = client.get(url, data=params).data
+        pages.append(result)
+        while result[link]:
+            result = client.get(result[link]).data
+            pages.append(result)
+        return pages
+
+    def test_01_list_forward_and_back(self, user_client, organization_1,
+                                      organization_2, unit_of_organization_1,
+                                      reset_page_size) -> None:
+        pages = self.walk(user_client, self.URL, {'cursor': ''})
+        for response_key in self.RESPONSE_KEYS:
+            assert response_key in pages[0]
+        assert pages[0]['date_info']
+        assert not pages[0]['previous']
+        addrs = [page['results'][0]['relative_addr'] for page in pages]
+        assert addrs == ['/api/organizations/1/', '/api/organizations/2/',
+                         '/api/organizations/3/']
+        back = [user_client.get(pages[-1]['previous']).data]
+        while back[-1]['previous']:
+            back.append(user_client.get(back[-1]['previous']).data)
+        back_addrs = [page['results'][0]['relative_addr'] for page in back]
+        assert back_addrs == addrs[-2::-1]
+
+    def test_02_fts_order(self, user_client, organization_1, organization_2,
+                          unit_of_organization_1) -> None:
+        params = {'q': 'министерство магии'}
+        expected = user_client.get(self.FTS_URL, data=params).data['results']
+        pages = self.walk(user_client, self.FTS_URL,
+                          {**params, 'cursor': ''})
+        assert pages[0]['results'] == expected
+
+    def test_03_fts_pages(self, user_client, organization_1, organization_2,
+                          unit_of_organization_1, reset_page_size) -> None:
+        params = {'q': 'министерство магии'}
+        pages = self.walk(user_client, self.FTS_URL,
+                          {**params, 'cursor': ''})
+        names = [page['results'][0]['full_name'] for page in pages]
+        assert names == ['МИНИСТЕРСТВО МАГИИ',
+                         'МИНИСТЕРСТВО МАГИИ РЕСПУБЛИКИ ЧУВАШИИ']
+
+    def test_04_bad_cursor(self, user_client, organization_1) -> None:
+        r = user_client.get(self.URL, data={'cursor': 'плохой'})
+        assert r.status_code == 404